@@ -0,0 +1,32 @@
+"""
+Shared pytest fixtures.
+"""
+from pathlib import Path
+
+import pytest
+
+from vault.security.crypto import KeyManager
+
+# Cheapest Argon2id parameters argon2-cffi accepts. Use wherever a test
+# needs a master key but does not exercise key strength.
+_FAST_KDF_PARAMS = {"time_cost": 1, "memory_cost": 8, "parallelism": 1}
+
+
+@pytest.fixture
+def passphrase() -> str:
+    return "correct horse battery staple"
+
+
+@pytest.fixture
+def fast_kdf_params() -> dict[str, int]:
+    return dict(_FAST_KDF_PARAMS)
+
+
+@pytest.fixture
+def fast_key_manager(tmp_path: Path, fast_kdf_params) -> KeyManager:
+    return KeyManager(tmp_path, **fast_kdf_params)
+
+
+@pytest.fixture
+def master_key(fast_key_manager: KeyManager, passphrase: str) -> bytes:
+    return fast_key_manager.derive_master_key(passphrase)
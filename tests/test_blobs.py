@@ -0,0 +1,95 @@
+"""
+Tests for encrypted blob storage.
+"""
+import uuid
+from pathlib import Path
+
+import pytest
+
+from vault.storage.blobs import BlobStore
+
+CONV_ID = "conv-1"
+
+
+@pytest.fixture
+def blob_store(tmp_path: Path, fast_key_manager) -> BlobStore:
+    return BlobStore(tmp_path / "blobs", fast_key_manager)
+
+
+class TestRetrieve:
+    def test_roundtrip(self, blob_store, master_key):
+        blob_id = blob_store.store(b"hello", master_key, CONV_ID)
+        assert blob_store.retrieve(blob_id, master_key, CONV_ID) == b"hello"
+
+    def test_missing_blob_checked_before_key(self, blob_store):
+        # A missing blob is reported even when the key arguments are invalid
+        with pytest.raises(FileNotFoundError):
+            blob_store.retrieve(str(uuid.uuid4()), b"short", "")
+
+
+class TestRetrieveMany:
+    def test_roundtrip_preserves_order(self, blob_store, master_key):
+        contents = [f"Message {i}".encode() for i in range(5)]
+        blob_ids = [blob_store.store(c, master_key, CONV_ID) for c in contents]
+
+        result = blob_store.retrieve_many(blob_ids, master_key, CONV_ID)
+
+        assert list(result) == blob_ids
+        assert list(result.values()) == contents
+
+    def test_duplicate_ids_collapse(self, blob_store, master_key):
+        a = blob_store.store(b"a", master_key, CONV_ID)
+        b = blob_store.store(b"b", master_key, CONV_ID)
+
+        result = blob_store.retrieve_many([a, b, a], master_key, CONV_ID)
+
+        assert result == {a: b"a", b: b"b"}
+        assert list(result) == [a, b]
+
+    def test_missing_id_mid_batch_raises(self, blob_store, master_key):
+        first = blob_store.store(b"first", master_key, CONV_ID)
+        last = blob_store.store(b"last", master_key, CONV_ID)
+        missing = str(uuid.uuid4())
+
+        with pytest.raises(FileNotFoundError, match=missing):
+            blob_store.retrieve_many([first, missing, last], master_key, CONV_ID)
+
+    def test_missing_id_checked_before_key(self, blob_store):
+        with pytest.raises(FileNotFoundError):
+            blob_store.retrieve_many([str(uuid.uuid4())], b"short", "")
+
+    def test_invalid_id_raises(self, blob_store, master_key):
+        with pytest.raises(ValueError, match="Invalid blob ID"):
+            blob_store.retrieve_many(["not-a-uuid"], master_key, CONV_ID)
+
+    def test_wrong_conversation_fails_decryption(self, blob_store, master_key):
+        blob_id = blob_store.store(b"secret", master_key, CONV_ID)
+
+        with pytest.raises(ValueError, match="Decryption failed"):
+            blob_store.retrieve_many([blob_id], master_key, "other-conv")
+
+    def test_empty_batch(self, blob_store, master_key):
+        assert blob_store.retrieve_many([], master_key, CONV_ID) == {}
+
+
+class TestTotalSize:
+    def test_counts_all_blobs(self, blob_store, master_key):
+        blob_ids = [blob_store.store(b"x" * 10, master_key, CONV_ID) for _ in range(3)]
+        expected = sum(blob_store._blob_path(b).stat().st_size for b in blob_ids)
+
+        assert blob_store.get_total_size() == expected
+
+    def test_empty_store(self, blob_store):
+        assert blob_store.get_total_size() == 0
+
+    def test_missing_root_returns_zero(self, blob_store):
+        blob_store.root.rmdir()
+
+        assert blob_store.get_total_size() == 0
+
+    def test_ignores_pruned_shards(self, blob_store, master_key):
+        kept = blob_store.store(b"kept", master_key, CONV_ID)
+        removed = blob_store.store(b"removed", master_key, CONV_ID)
+        blob_store.delete(removed)
+
+        assert blob_store.get_total_size() == blob_store._blob_path(kept).stat().st_size
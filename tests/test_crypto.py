@@ -0,0 +1,119 @@
+"""
+Tests for key derivation and management.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+from vault.security import crypto
+from vault.security.crypto import KeyManager
+
+
+class TestArgon2Params:
+    def test_defaults_use_production_argon2_params(self, tmp_path: Path):
+        km = KeyManager(tmp_path)
+
+        assert km.time_cost == crypto._ARGON2_TIME_COST
+        assert km.memory_cost == crypto._ARGON2_MEMORY_COST
+        assert km.parallelism == crypto._ARGON2_PARALLELISM
+
+    def test_cheap_params_produce_a_different_key(
+        self, tmp_path: Path, fast_key_manager, passphrase
+    ):
+        fast_key = fast_key_manager.derive_master_key(passphrase)
+        prod_key = KeyManager(tmp_path).derive_master_key(passphrase)
+
+        assert len(fast_key) == 32
+        assert fast_key != prod_key
+
+    def test_same_params_are_deterministic(
+        self, tmp_path: Path, fast_kdf_params, passphrase
+    ):
+        first = KeyManager(tmp_path, **fast_kdf_params).derive_master_key(passphrase)
+        second = KeyManager(tmp_path, **fast_kdf_params).derive_master_key(passphrase)
+
+        assert first == second
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"time_cost": 0},
+            {"parallelism": 0},
+            {"memory_cost": 7, "parallelism": 1},
+            {"memory_cost": 16, "parallelism": 4},
+        ],
+    )
+    def test_invalid_argon2_params_rejected(self, tmp_path: Path, params):
+        with pytest.raises(ValueError):
+            KeyManager(tmp_path, **params)
+
+
+class TestSaltCache:
+    def test_same_key_twice(self, fast_key_manager, passphrase):
+        first = fast_key_manager.derive_master_key(passphrase)
+        second = fast_key_manager.derive_master_key(passphrase)
+
+        assert first == second
+
+    def test_unchanged_salt_is_not_reread(
+        self, fast_key_manager, passphrase, monkeypatch
+    ):
+        fast_key_manager.derive_master_key(passphrase)
+
+        def fail(*args, **kwargs):
+            raise AssertionError(".salt re-read although unchanged")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        fast_key_manager.derive_master_key(passphrase)
+
+    def test_replaced_salt_is_picked_up(
+        self, tmp_path: Path, fast_key_manager, fast_kdf_params, passphrase
+    ):
+        old_key = fast_key_manager.derive_master_key(passphrase)
+
+        # Simulate a restore: a different salt written as a new file
+        fast_key_manager.salt_file.unlink()
+        (tmp_path / ".salt").write_bytes(b"\x01" * 16)
+
+        new_key = fast_key_manager.derive_master_key(passphrase)
+        fresh_key = KeyManager(tmp_path, **fast_kdf_params).derive_master_key(
+            passphrase
+        )
+        assert new_key != old_key
+        assert new_key == fresh_key
+
+    def test_rewritten_salt_is_picked_up(
+        self, tmp_path: Path, fast_key_manager, fast_kdf_params, passphrase
+    ):
+        fast_key_manager.derive_master_key(passphrase)
+
+        # Rewrite in place: same inode and size, new content. Bump mtime so
+        # the rewrite is visible even within one filesystem timestamp tick.
+        salt_file = fast_key_manager.salt_file
+        mtime_ns = salt_file.stat().st_mtime_ns
+        salt_file.write_bytes(b"\x02" * 16)
+        os.utime(salt_file, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+        fresh_key = KeyManager(tmp_path, **fast_kdf_params).derive_master_key(
+            passphrase
+        )
+        assert fast_key_manager.derive_master_key(passphrase) == fresh_key
+
+    def test_deleted_salt_is_regenerated(self, fast_key_manager, passphrase):
+        old_key = fast_key_manager.derive_master_key(passphrase)
+        fast_key_manager.salt_file.unlink()
+
+        new_key = fast_key_manager.derive_master_key(passphrase)
+
+        assert fast_key_manager.salt_file.exists()
+        assert new_key != old_key
+
+    def test_corrupt_salt_is_not_cached(self, fast_key_manager, passphrase):
+        fast_key_manager.salt_file.write_bytes(b"short")
+
+        with pytest.raises(ValueError, match="Corrupt salt file"):
+            fast_key_manager.derive_master_key(passphrase)
+
+        fast_key_manager.salt_file.write_bytes(b"\x03" * 16)
+        assert len(fast_key_manager.derive_master_key(passphrase)) == 32
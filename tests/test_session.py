@@ -0,0 +1,99 @@
+"""
+Tests for session token management.
+"""
+import os
+import stat
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from vault.security.session import SessionManager
+
+MASTER_KEY = b"k" * 32
+
+unix_only = pytest.mark.skipif(
+    sys.platform == "win32", reason="POSIX permissions and symlinks"
+)
+
+
+@pytest.fixture
+def session_manager(tmp_path: Path) -> SessionManager:
+    return SessionManager(tmp_path)
+
+
+def _temp_files(session_manager: SessionManager) -> list[Path]:
+    return list(session_manager.session_file.parent.glob(".session.*"))
+
+
+def test_create_and_validate_session(session_manager):
+    token = session_manager.create_session(MASTER_KEY)
+
+    assert session_manager.validate_token(token) == MASTER_KEY
+    assert _temp_files(session_manager) == []
+
+
+@unix_only
+def test_session_file_is_owner_only(session_manager):
+    session_manager.create_session(MASTER_KEY)
+
+    mode = stat.S_IMODE(session_manager.session_file.stat().st_mode)
+    assert mode == 0o600
+
+
+@unix_only
+def test_existing_tmp_path_is_not_reused(session_manager, tmp_path):
+    # Neither a stale world-readable file nor a planted symlink at the old
+    # fixed temp path is written through
+    stale = session_manager.session_file.with_suffix(".tmp")
+    stale.write_text("stale")
+    os.chmod(stale, 0o644)
+    target = tmp_path / "target"
+    target.write_text("untouched")
+    (tmp_path / ".session.link.tmp").symlink_to(target)
+
+    token = session_manager.create_session(MASTER_KEY)
+
+    assert stale.read_text() == "stale"
+    assert target.read_text() == "untouched"
+    assert stat.S_IMODE(session_manager.session_file.stat().st_mode) == 0o600
+    assert session_manager.validate_token(token) == MASTER_KEY
+
+
+def test_concurrent_writers_do_not_clobber(tmp_path: Path, monkeypatch):
+    # Hold both writers at os.replace so their temp files coexist, then let
+    # them rename one after the other
+    both_written = threading.Barrier(2, timeout=5)
+    real_replace = os.replace
+
+    def replace_after_both_written(src, dst):
+        both_written.wait()
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", replace_after_both_written)
+
+    keys = [b"a" * 32, b"b" * 32]
+    tokens: list = [None, None]
+    errors: list = []
+
+    def create(i: int) -> None:
+        try:
+            tokens[i] = SessionManager(tmp_path).create_session(keys[i])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    sm = SessionManager(tmp_path)
+    # The last rename wins with a complete, valid session; the other token
+    # is simply stale
+    valid = [key for key in map(sm.validate_token, tokens) if key is not None]
+    assert len(valid) == 1
+    assert valid[0] in keys
+    assert _temp_files(sm) == []
@@ -52,18 +52,57 @@ class KeyManager:
 
     Attributes:
         vault_root: Root directory of the vault (contains .salt file).
+        time_cost: Argon2id iteration count.
+        memory_cost: Argon2id memory cost in KiB.
+        parallelism: Argon2id lane count.
     """
 
-    def __init__(self, vault_root: Path) -> None:
+    def __init__(
+        self,
+        vault_root: Path,
+        *,
+        time_cost: int = _ARGON2_TIME_COST,
+        memory_cost: int = _ARGON2_MEMORY_COST,
+        parallelism: int = _ARGON2_PARALLELISM,
+    ) -> None:
         """Initialize the KeyManager.
 
+        The Argon2id cost parameters default to the production values and
+        should only be lowered where key strength does not matter (e.g. test
+        fixtures). The same parameters must be used for every derivation
+        against a given vault, or a different master key will be produced.
+
         Args:
             vault_root: Path to the vault root directory. The .salt file
                 will be stored here.
+            time_cost: Argon2id iteration count.
+            memory_cost: Argon2id memory cost in KiB.
+            parallelism: Argon2id lane count.
+
+        Raises:
+            ValueError: If time_cost or parallelism is below 1, or
+                memory_cost is below the Argon2 minimum of 8 KiB per lane.
         """
+        if time_cost < 1:
+            raise ValueError(f"time_cost must be at least 1, got {time_cost}")
+        if parallelism < 1:
+            raise ValueError(
+                f"parallelism must be at least 1, got {parallelism}"
+            )
+        if memory_cost < 8 * parallelism:
+            raise ValueError(
+                f"memory_cost must be at least {8 * parallelism} KiB "
+                f"for parallelism={parallelism}, got {memory_cost}"
+            )
+
         self.vault_root = vault_root
         self.salt_file = vault_root / ".salt"
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
         self._master_key: Optional[bytes] = None
+        self._salt: Optional[bytes] = None
+        self._salt_sig: Optional[tuple[int, ...]] = None
 
     def derive_master_key(self, passphrase: str) -> bytes:
         """Derive a 256-bit master key from a passphrase using Argon2id.
@@ -90,9 +129,9 @@ class KeyManager:
         master_key = argon2.low_level.hash_secret_raw(
             secret=passphrase.encode("utf-8"),
             salt=salt,
-            time_cost=_ARGON2_TIME_COST,
-            memory_cost=_ARGON2_MEMORY_COST,
-            parallelism=_ARGON2_PARALLELISM,
+            time_cost=self.time_cost,
+            memory_cost=self.memory_cost,
+            parallelism=self.parallelism,
             hash_len=_ARGON2_HASH_LEN,
             type=argon2.low_level.Type.ID,
         )
@@ -219,26 +258,54 @@ class KeyManager:
     def _load_or_create_salt(self) -> bytes:
         """Load existing salt from disk, or generate and save a new one.
 
+        The loaded salt is cached on the instance together with the .salt
+        file's stat signature (inode, size, mtime, ctime). Later calls only
+        stat the file and re-read it if the signature changed, so a salt that
+        is rewritten, restored or deleted is picked up rather than silently
+        reused. (An in-place rewrite of the same size within one filesystem
+        timestamp tick is not detectable this way.)
+
         Returns:
             16-byte salt.
 
         Raises:
+            ValueError: If the salt file is corrupt.
             OSError: If the salt file cannot be read or written.
         """
-        if self.salt_file.exists():
+        try:
+            signature: Optional[tuple[int, ...]] = self._salt_signature()
+        except FileNotFoundError:
+            signature = None
+
+        if signature is not None:
+            if self._salt is not None and signature == self._salt_sig:
+                return self._salt
+
             salt = self.salt_file.read_bytes()
             if len(salt) != _ARGON2_SALT_LEN:
+                self._salt = self._salt_sig = None
                 raise ValueError(
                     f"Corrupt salt file: expected {_ARGON2_SALT_LEN} bytes, "
                     f"got {len(salt)}"
                 )
+            self._salt, self._salt_sig = salt, signature
             return salt
 
         salt = secrets.token_bytes(_ARGON2_SALT_LEN)
         self.salt_file.parent.mkdir(parents=True, exist_ok=True)
         self.salt_file.write_bytes(salt)
+        self._salt, self._salt_sig = salt, self._salt_signature()
         return salt
 
+    def _salt_signature(self) -> tuple[int, ...]:
+        """Return the stat fields used to detect a changed .salt file.
+
+        Raises:
+            FileNotFoundError: If the salt file does not exist.
+        """
+        st = self.salt_file.stat()
+        return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
     def get_master_key_hash(self, master_key: bytes) -> str:
         """Get a SHA-256 hash of the master key for identity comparison.
 
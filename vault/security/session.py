@@ -8,6 +8,7 @@ Security principles:
 - Raw token never stored on disk — only its SHA-256 hash
 - Master key encrypted before disk write using a key derived from the token
 - Session files have restricted permissions (0600 on Unix)
+- Atomic writes (write to a unique temp file, then rename)
 - Automatic expiry after configurable timeout
 """
 from __future__ import annotations
@@ -16,8 +17,8 @@ import base64
 import hashlib
 import json
 import os
-import platform
 import secrets
+import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -96,12 +97,25 @@ class SessionManager:
             "expires_at": expires_at.isoformat(),
         }
 
-        self.session_file.write_text(
-            json.dumps(session_data, indent=2), encoding="utf-8"
+        # Atomic write: mkstemp creates a uniquely named file with O_EXCL and
+        # mode 0600, so the encrypted key only ever lands in a fresh,
+        # owner-only file, and concurrent writers never share a temp path.
+        # os.replace then swaps it in whole, so readers of .session see
+        # either the old or a complete new file.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=str(self.session_file.parent), prefix=".session.", suffix=".tmp"
         )
-
-        if platform.system() != "Windows":
-            os.chmod(str(self.session_file), 0o600)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(session_data, indent=2))
+            os.replace(tmp_name, str(self.session_file))
+        except Exception:
+            # tmp_name is ours alone; no other writer can be using it
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
 
         return token
 
@@ -17,6 +17,7 @@ import os
 import platform
 import uuid
 from pathlib import Path
+from typing import Iterable
 
 from cryptography.fernet import Fernet, InvalidToken
 
@@ -124,24 +125,52 @@ class BlobStore:
             ValueError: If decryption fails (wrong key or corrupted data).
         """
         self._validate_blob_id(blob_id)
-        blob_path = self._blob_path(blob_id)
+        encrypted = self._read_blob(blob_id)
+        fernet = self.key_manager.get_fernet(master_key, conversation_id)
+        return self._decrypt(blob_id, encrypted, fernet)
 
-        if not blob_path.exists():
-            raise FileNotFoundError(
-                f"Blob not found: {blob_id} "
-                f"(expected at {blob_path})"
-            )
+    def retrieve_many(
+        self, blob_ids: Iterable[str], master_key: bytes, conversation_id: str
+    ) -> dict[str, bytes]:
+        """Decrypt and return several blobs from the same conversation.
 
-        encrypted = blob_path.read_bytes()
-        fernet = self.key_manager.get_fernet(master_key, conversation_id)
+        The conversation key is derived once and the Fernet instance reused
+        for every blob, instead of paying HKDF and Fernet setup per call as
+        repeated retrieve() calls would.
 
-        try:
-            return fernet.decrypt(encrypted)
-        except InvalidToken as e:
-            raise ValueError(
-                f"Decryption failed for blob {blob_id}. "
-                "This may indicate a wrong passphrase or corrupted data."
-            ) from e
+        Errors are raised in the same order as retrieve(): every ID is
+        validated, then every blob file is read, and only then is the key
+        derived and each blob decrypted. A missing blob therefore raises
+        FileNotFoundError even if the key arguments are also invalid, and
+        nothing is decrypted unless all blobs exist. Duplicate IDs are read
+        and decrypted once.
+
+        Args:
+            blob_ids: Blob IDs returned by store(), all belonging to
+                conversation_id.
+            master_key: The 32-byte master key.
+            conversation_id: Conversation the blobs belong to.
+
+        Returns:
+            Mapping of blob ID to decrypted plaintext, in first-seen input
+            order.
+
+        Raises:
+            FileNotFoundError: If any blob file does not exist.
+            ValueError: If any blob ID is invalid, the key arguments are
+                invalid, or decryption fails.
+        """
+        unique_ids = list(dict.fromkeys(blob_ids))
+        for blob_id in unique_ids:
+            self._validate_blob_id(blob_id)
+
+        encrypted = {blob_id: self._read_blob(blob_id) for blob_id in unique_ids}
+
+        fernet = self.key_manager.get_fernet(master_key, conversation_id)
+        return {
+            blob_id: self._decrypt(blob_id, data, fernet)
+            for blob_id, data in encrypted.items()
+        }
 
     def delete(self, blob_id: str) -> bool:
         """Securely delete a blob file.
@@ -191,14 +220,76 @@ class BlobStore:
     def get_total_size(self) -> int:
         """Calculate total size of all encrypted blob files.
 
+        Walks the tree with os.scandir so directory entries supply the file
+        type without an extra stat() per entry. A missing root, or a shard
+        or blob removed mid-walk (e.g. pruned by delete()), counts as empty.
+
         Returns:
-            Total size in bytes of all .enc files under the blob root.
+            Total size in bytes of all .enc files under the blob root, or 0
+            if the root does not exist.
         """
         total = 0
-        for enc_file in self.root.rglob("*.enc"):
-            total += enc_file.stat().st_size
+        stack = [str(self.root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".enc"):
+                            try:
+                                total += entry.stat(follow_symlinks=False).st_size
+                            except FileNotFoundError:
+                                pass  # Deleted since the directory was listed
+            except FileNotFoundError:
+                continue  # Root or shard directory no longer exists
         return total
 
+    def _read_blob(self, blob_id: str) -> bytes:
+        """Read the encrypted bytes of a blob file.
+
+        Args:
+            blob_id: A validated blob ID.
+
+        Returns:
+            The encrypted blob content.
+
+        Raises:
+            FileNotFoundError: If the blob file does not exist.
+        """
+        blob_path = self._blob_path(blob_id)
+
+        if not blob_path.exists():
+            raise FileNotFoundError(
+                f"Blob not found: {blob_id} "
+                f"(expected at {blob_path})"
+            )
+
+        return blob_path.read_bytes()
+
+    @staticmethod
+    def _decrypt(blob_id: str, encrypted: bytes, fernet: Fernet) -> bytes:
+        """Decrypt blob content with an already-keyed Fernet.
+
+        Args:
+            blob_id: The blob ID, used in the error message.
+            encrypted: Encrypted content read by _read_blob().
+            fernet: Fernet instance for the blob's conversation.
+
+        Returns:
+            Decrypted plaintext content.
+
+        Raises:
+            ValueError: If decryption fails (wrong key or corrupted data).
+        """
+        try:
+            return fernet.decrypt(encrypted)
+        except InvalidToken as e:
+            raise ValueError(
+                f"Decryption failed for blob {blob_id}. "
+                "This may indicate a wrong passphrase or corrupted data."
+            ) from e
+
     def _blob_path(self, blob_id: str) -> Path:
         """Compute the filesystem path for a blob.
 